@@ -1,14 +1,79 @@
 import argparse
-from bs4 import BeautifulSoup
-from collections import deque
-from dataclasses import dataclass
-from datetime import datetime
-import pandas as pd
+import asyncio
+import codecs
+import csv
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from functools import lru_cache
+import httpx
+import lxml.etree
+import lxml.html
+import openpyxl
+import os
 import random
 import re
 import requests
-from time import sleep
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+import sqlite3
+from time import sleep, time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)  # Content-Type 헤더의 charset
+
+# 페이지마다 다시 컴파일하지 않도록 미리 컴파일한 XPath 표현식
+_NAME_XPATH = lxml.etree.XPath("//h2")  # 이름
+_ID_HREF_XPATH = lxml.etree.XPath('(//a[contains(@href, "id.php?id=")])[1]/@href')  # 첫 번째 수학자 페이지 링크
+_ADVISOR_HREF_XPATH = lxml.etree.XPath('//*[text()[contains(., "Advisor")]]/a[contains(@href, "id.php?id=")]/@href')  # "Advisor" 레이블 옆의 링크
+_DEGREE_INFO_XPATH = lxml.etree.XPath('//*[@id="paddingWrapper"]/*[6][self::div]')  # paddingWrapper의 6번째 자식 div
+_MAIN_SPAN_XPATH = lxml.etree.XPath("(.//span)[1]")  # 학위 정보 span
+_UNIVERSITY_SPAN_XPATH = lxml.etree.XPath('(.//span[contains(@style, "color:")])[1]')  # color 스타일이 적용된 대학 span
+_FLAG_TITLE_XPATH = lxml.etree.XPath('(.//img[substring(@src, string-length(@src) - 3) = ".gif"])[1]/@title')  # 국기 이미지 title
+
+def response_encoding(content_type: str) -> str:
+    """Content-Type 헤더에서 응답 본문의 인코딩을 추출
+
+    Args:
+        content_type (str): Content-Type 헤더 값
+
+    Returns:
+        str: 헤더에 명시된 charset 또는 utf-8 (명시되지 않았거나 알 수 없는 인코딩인 경우)
+    """
+    match = _CHARSET_RE.search(content_type)
+    if not match:
+        return "utf-8"
+
+    encoding = match.group(1)
+    try:
+        codecs.lookup(encoding)
+        html_parser(encoding)  # lxml도 지원하는 인코딩인지 확인 (파서는 인코딩별로 캐시됨)
+    except LookupError:
+        return "utf-8"
+    return encoding
+
+@lru_cache(maxsize=None)
+def html_parser(encoding: str) -> lxml.html.HTMLParser:
+    """주어진 인코딩으로 디코딩하는 HTML 파서를 생성 (인코딩별로 한 번만 생성)
+
+    Args:
+        encoding (str): 페이지 인코딩
+
+    Returns:
+        lxml.html.HTMLParser: 인코딩이 고정된 HTML 파서
+    """
+    return lxml.html.HTMLParser(encoding=encoding)
+
+def parse_html(content: bytes, encoding: str) -> lxml.html.HtmlElement:
+    """페이지 본문을 이미 알고 있는 인코딩으로 파싱 (인코딩 추측 과정 생략)
+
+    Args:
+        content (bytes): 페이지 본문
+        encoding (str): 페이지 인코딩
+
+    Returns:
+        lxml.html.HtmlElement: 파싱된 HTML 페이지
+    """
+    return lxml.html.fromstring(content, parser=html_parser(encoding))
 
 @dataclass
 class Mathematician:
@@ -20,14 +85,69 @@ class Mathematician:
     degree_type: str  # 학위 종류
     nationality: str  # 국적
     level: int  # 세대 레벨
-    url: str  # URL
     descended_from: List[str]  # Advisor들의 ID 목록
 
+class PageCache:
+    """수학자 페이지 응답을 sqlite 파일에 저장하는 디스크 캐시"""
+
+    def __init__(self, path: str, expire_after: timedelta = timedelta(days=30)):
+        """캐시 초기화
+
+        Args:
+            path (str): 캐시로 사용할 sqlite 파일 경로
+            expire_after (timedelta): 저장된 페이지의 유효 기간 (기본값: 30일)
+        """
+        self.expire_after = expire_after
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS pages (id TEXT PRIMARY KEY, content BLOB NOT NULL, encoding TEXT NOT NULL, fetched_at REAL NOT NULL)")
+        self.conn.commit()
+
+    def get(self, id: str) -> Optional[Tuple[bytes, str]]:
+        """캐시에서 페이지 본문과 인코딩을 가져옴
+
+        Args:
+            id (str): 수학자 ID
+
+        Returns:
+            Optional[Tuple[bytes, str]]: 페이지 본문과 인코딩 또는 None (저장되지 않았거나 유효 기간이 지난 경우)
+        """
+        row = self.conn.execute("SELECT content, encoding, fetched_at FROM pages WHERE id = ?", (id,)).fetchone()
+        if row is None or time() - row[2] > self.expire_after.total_seconds():
+            return None
+        return row[0], row[1]
+
+    def set(self, id: str, content: bytes, encoding: str):
+        """페이지 본문과 인코딩을 캐시에 저장
+
+        Args:
+            id (str): 수학자 ID
+            content (bytes): 페이지 본문
+            encoding (str): 페이지 인코딩
+        """
+        self.conn.execute("INSERT OR REPLACE INTO pages (id, content, encoding, fetched_at) VALUES (?, ?, ?, ?)", (id, content, encoding, time()))
+        self.conn.commit()
+
+    def delete(self, id: str):
+        """캐시에서 페이지를 삭제
+
+        Args:
+            id (str): 수학자 ID
+        """
+        self.conn.execute("DELETE FROM pages WHERE id = ?", (id,))
+        self.conn.commit()
+
 class MathGenealogyScraper:
     """Mathematics Genealogy Project 웹사이트를 스크래핑하는 클래스"""
     BASE_URL = "https://genealogy.math.ndsu.nodak.edu"
-
-    def __init__(self, start_id: int, end_id: Optional[int] = None, end_depth: int = 15, wait_sec: float = 2.5, verbose: bool = True):
+    HEADERS = {
+        "User-Agent": "my-math-gene-scraper (+https://github.com/shhommychon/my-math-gene-scraper)",
+        "Accept-Encoding": "gzip, deflate",
+    }
+    TIMEOUT = 15  # 요청 타임아웃 (초)
+    COLUMNS = ["name", "id", "university", "year", "degree_type", "nationality", "level", "descended_from", "url"]  # 출력 컬럼 순서
+    CHECKPOINT_COLUMNS = ["crawl_id"] + COLUMNS  # 체크포인트 컬럼 순서 (crawl_id: 페이지를 요청할 때 사용한 ID)
+
+    def __init__(self, start_id: int, end_id: Optional[int] = None, end_depth: int = 15, wait_sec: float = 2.5, concurrency: int = 1, cache_path: Optional[str] = None, checkpoint_path: Optional[str] = None, checkpoint_every: int = 100, verbose: bool = True):
         """스크래퍼 초기화
 
         Args:
@@ -35,19 +155,36 @@ class MathGenealogyScraper:
             end_id (Optional[int]): 탐색을 중단할 수학자의 ID (기본값: None)
             end_depth (int): 탐색을 중단할 최대 세대 깊이 (기본값: 15)
             wait_sec (float): 요청 간 대기 시간 (초) (기본값: 2.5)
+            concurrency (int): scrape_async에서 동시에 보낼 최대 요청 수 (기본값: 1)
+            cache_path (Optional[str]): 페이지 캐시로 사용할 sqlite 파일 경로, None이면 캐시 미사용 (기본값: None)
+            checkpoint_path (Optional[str]): 수집한 수학자 정보를 중간 저장할 CSV 파일 경로, None이면 중간 저장 미사용 (기본값: None)
+            checkpoint_every (int): 체크포인트 파일에 기록할 수학자 수 단위 (기본값: 100)
             verbose (bool): 상세 로그 출력 여부 (기본값: True)
         """
         self.start_id = str(start_id)
         self.end_id = str(end_id) if end_id else None
         self.end_depth = end_depth
         self.wait_sec = wait_sec
+        self.concurrency = concurrency
         self.verbose = verbose
-        self.visited = set()  # 방문한 페이지 추적
+        self.queued = set()  # 큐에 추가된 페이지 추적 (한 번 추가된 ID는 다시 방문하지 않음)
         self.queue = deque()  # BFS를 위한 큐
         self.mathematicians = []  # 수집된 수학자 정보
-        self.parent_map = {}  # 자식 -> 부모(들) 매핑
+        self.parent_map = defaultdict(list)  # 자식 -> 부모(들) 매핑
         self.target_found = False  # 목표 수학자를 찾았는지 여부
         self.target_level = 0  # 목표 수학자의 세대 레벨
+        self.cache = PageCache(cache_path) if cache_path else None  # 페이지 캐시
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.pending = []  # 체크포인트 파일에 아직 기록하지 않은 (요청한 ID, 수학자 정보) 목록
+        self.checkpoint = self.load_checkpoint() if checkpoint_path else {}  # 이전 실행에서 수집한 요청한 ID -> 수학자 정보
+
+        # 같은 호스트에 반복 요청하므로 keep-alive 연결을 재사용하는 세션 생성
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.HEADERS)
 
     def log(self, message: str):
         """로그 메시지 출력
@@ -59,31 +196,120 @@ class MathGenealogyScraper:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             print(f"[{timestamp}] {message}")
 
-    def get_page(self, id: str) -> Optional[BeautifulSoup]:
+    def page_url(self, id: str) -> str:
+        """주어진 ID의 수학자 페이지 URL을 생성
+
+        Args:
+            id (str): 수학자 ID
+
+        Returns:
+            str: 수학자 페이지 URL
+        """
+        return f"{self.BASE_URL}/id.php?id={id}"
+
+    def random_delay(self) -> float:
+        """요청 전 대기할 지연 시간을 계산
+
+        Returns:
+            float: wait_sec에 랜덤 지터를 더한 지연 시간 (초)
+        """
+        return max(
+            0,  # 음수가 되지 않도록 보호
+            self.wait_sec + random.uniform(-0.1, 0.15), # -0.1에서 0.15 사이의 랜덤 지연 시간 추가
+        )
+
+    def get_page(self, id: str) -> Optional[lxml.html.HtmlElement]:
         """주어진 ID의 수학자 페이지를 가져옴
 
         Args:
             id (str): 수학자 ID
 
         Returns:
-            Optional[BeautifulSoup]: 파싱된 HTML 페이지 또는 None (에러 발생 시)
+            Optional[lxml.html.HtmlElement]: 파싱된 HTML 페이지 또는 None (에러 발생 시)
         """
-        url = f"{self.BASE_URL}/id.php?id={id}"
+        url = self.page_url(id)
+
+        # 캐시된 페이지는 서버에 요청하지 않으므로 대기 없이 바로 사용
+        if self.cache is not None:
+            page = self.cache.get(id)
+            if page is not None:
+                self.log(f"캐시된 페이지 사용: {url}")
+                return self.parse_page(id, *page)
+
         try:
-            random_delay = max(
-                0,  # 음수가 되지 않도록 보호
-                self.wait_sec + max(min(random.gauss(0, 0.1), 0.15), -0.1), # -0.1에서 0.15 사이의 랜덤 지연 시간 추가
-            )
+            random_delay = self.random_delay()
             self.log(f"페이지 가져오는 중: {url}")
             sleep(random_delay)
 
-            response = requests.get(url)
+            response = self.session.get(url, timeout=self.TIMEOUT)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            encoding = response_encoding(response.headers.get("Content-Type", ""))
+            tree = self.parse_page(id, response.content, encoding)
+            # 파싱에 성공한 페이지만 캐시에 저장
+            if tree is not None and self.cache is not None:
+                self.cache.set(id, response.content, encoding)
+            return tree
         except requests.RequestException as e:
             self.log(f"페이지 {id} 가져오기 오류: {e}")
             return None
 
+    def parse_page(self, id: str, content: bytes, encoding: str) -> Optional[lxml.html.HtmlElement]:
+        """페이지 본문을 파싱
+
+        Args:
+            id (str): 수학자 ID
+            content (bytes): 페이지 본문
+            encoding (str): 페이지 인코딩
+
+        Returns:
+            Optional[lxml.html.HtmlElement]: 파싱된 HTML 페이지 또는 None (본문이 비어 있는 등 파싱할 수 없는 경우)
+        """
+        try:
+            return parse_html(content, encoding)
+        except lxml.etree.ParserError as e:
+            self.log(f"페이지 {id} 파싱 오류: {e}")
+            # 파싱할 수 없는 페이지가 캐시에 남아 있으면 다시 실행해도 서버에 재요청하지 않으므로 삭제
+            if self.cache is not None:
+                self.cache.delete(id)
+            return None
+
+    async def fetch_page_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, id: str) -> Optional[Tuple[bytes, str]]:
+        """주어진 ID의 수학자 페이지를 비동기로 가져옴
+
+        Args:
+            client (httpx.AsyncClient): 요청에 사용할 클라이언트
+            semaphore (asyncio.Semaphore): 동시 요청 수를 제한하는 세마포어
+            id (str): 수학자 ID
+
+        Returns:
+            Optional[Tuple[bytes, str]]: 페이지 본문과 인코딩 또는 None (에러 발생 시)
+        """
+        url = self.page_url(id)
+
+        # 캐시된 페이지는 서버에 요청하지 않으므로 대기 없이 바로 사용
+        if self.cache is not None:
+            page = self.cache.get(id)
+            if page is not None:
+                self.log(f"캐시된 페이지 사용: {url}")
+                return page
+
+        async with semaphore:
+            try:
+                random_delay = self.random_delay()
+                self.log(f"페이지 가져오는 중: {url}")
+                await asyncio.sleep(random_delay)
+
+                response = await client.get(url)
+                response.raise_for_status()
+                encoding = response_encoding(response.headers.get("Content-Type", ""))
+                # 캐시에 저장된 페이지는 scrape_async에서 파싱에 실패하면 parse_page가 다시 삭제
+                if self.cache is not None:
+                    self.cache.set(id, response.content, encoding)
+                return response.content, encoding
+            except httpx.HTTPError as e:
+                self.log(f"페이지 {id} 가져오기 오류: {e}")
+                return None
+
     def collapse_whitespace(self, text: str) -> str:
         """텍스트에서 연속된 공백을 단일 공백으로 변환하고 앞뒤 공백을 제거
 
@@ -93,53 +319,60 @@ class MathGenealogyScraper:
         Returns:
             str: 공백이 정리된 텍스트
         """
-        return re.sub(r'\s+', ' ', text).strip()
+        return " ".join(text.split())
 
-    def parse_mathematician(self, soup: BeautifulSoup, level: int, advisors: List[str]) -> Optional[Mathematician]:
-        """HTML에서 수학자 정보를 파싱
+    def parse_mathematician(self, tree: lxml.html.HtmlElement, level: int) -> Tuple[Optional[Mathematician], List[str]]:
+        """HTML에서 수학자 정보와 Advisor들의 ID를 파싱
 
         Args:
-            soup (BeautifulSoup): 파싱할 HTML
+            tree (lxml.html.HtmlElement): 파싱할 HTML
             level (int): 현재 세대 레벨
-            advisors (List[str]): Advisor들의 ID 목록
 
         Returns:
-            Optional[Mathematician]: 파싱된 수학자 정보 또는 None (파싱 실패 시)
+            Tuple[Optional[Mathematician], List[str]]: 파싱된 수학자 정보 또는 None (파싱 실패 시), Advisor ID 목록
         """
+        # "Advisor" 레이블이 있는 요소의 링크들만 골라 Advisor ID 목록 추출
+        # (수학자 정보 파싱에 실패하더라도 Advisor 관계는 기록되도록 먼저 추출)
+        advisors = [href.split('=')[-1] for href in _ADVISOR_HREF_XPATH(tree)]
+
         try:
             # 이름 추출 및 whitespace 정리
-            name = self.collapse_whitespace(soup.find("h2").text)
+            name = self.collapse_whitespace(_NAME_XPATH(tree)[0].text_content())
 
             # URL에서 ID 추출
-            id = soup.find('a', href=lambda x: x and "id.php?id=" in x)["href"].split('=')[-1]
+            id = _ID_HREF_XPATH(tree)[0].split('=')[-1]
 
             # 기타 세부 정보 추출
             details = {}
 
             # 학위 정보 div 찾기
-            degree_info = soup.select_one("#paddingWrapper > div:nth-child(6)") # paddingWrapper의 6번째 자식 div
+            degree_info = _DEGREE_INFO_XPATH(tree)
             if degree_info:
+                degree_info = degree_info[0]
+
                 # 전체 텍스트 추출
-                main_span = degree_info.find("span")
+                main_span = _MAIN_SPAN_XPATH(degree_info)
                 if main_span:
-                    full_text = main_span.text.strip()
+                    main_span = main_span[0]
+                    full_text = main_span.text_content().strip()
 
                     # 대학 이름 추출 (color 스타일이 적용된 span)
-                    university_span = main_span.find("span", style=lambda x: x and "color:" in x)
+                    university_span = _UNIVERSITY_SPAN_XPATH(main_span)
                     if university_span:
-                        details["university"] = self.collapse_whitespace(university_span.text)
+                        university_text = university_span[0].text_content()
+                        details["university"] = self.collapse_whitespace(university_text)
                         # 대학 이름을 기준으로 앞뒤 텍스트 분리
-                        parts = full_text.split(university_span.text.strip())
+                        parts = full_text.split(university_text.strip())
                         if len(parts) == 2:
                             # Ph.D. 추출 (대학 이름 앞의 텍스트)
                             details["degree_type"] = self.collapse_whitespace(parts[0])
                             # 연도 추출 (대학 이름 뒤의 텍스트)
                             details["year"] = self.collapse_whitespace(parts[1])
 
-                # 국적 추출
-                flag_img = degree_info.find("img", src=lambda x: x and x.endswith(".gif"))
-                if flag_img and flag_img.get("title"):
-                    details["nationality"] = self.collapse_whitespace(flag_img["title"])
+                # 국적 추출 (.gif로 끝나는 국기 이미지의 title)
+                flag_title = _FLAG_TITLE_XPATH(degree_info)
+                if flag_title and flag_title[0]:
+                    details["nationality"] = self.collapse_whitespace(flag_title[0])
 
             mathematician = Mathematician(
                 name=name,
@@ -149,91 +382,268 @@ class MathGenealogyScraper:
                 degree_type=details.get("degree_type", ''),
                 nationality=details.get("nationality", ''),
                 level=level,
-                url=f"{self.BASE_URL}/id.php?id={id}",
                 descended_from=advisors
             )
 
             self.log(f"수학자 정보 파싱 완료: {name} (ID: {id}, 레벨: {level})")
-            return mathematician
+            return mathematician, advisors
         except Exception as e:
             self.log(f"수학자 정보 파싱 오류: {e}")
-            return None
+            return None, advisors
 
-    def get_advisors(self, soup: BeautifulSoup) -> List[str]:
-        """페이지에서 Advisor들의 ID를 추출
+    def handle_page(self, current_id: str, level: int, tree: lxml.html.HtmlElement) -> List[str]:
+        """가져온 페이지를 파싱하여 수집 결과에 반영
 
         Args:
-            soup (BeautifulSoup): 파싱할 HTML
+            current_id (str): 현재 수학자 ID
+            level (int): 현재 세대 레벨
+            tree (lxml.html.HtmlElement): 파싱할 HTML
 
         Returns:
-            List[str]: Advisor ID 목록
+            List[str]: 다음 세대에서 탐색할 Advisor ID 목록 (파싱 실패 시 빈 목록)
         """
-        advisors = []
-        for link in soup.find_all('a', href=lambda x: x and "id.php?id=" in x):
-            if "Advisor" in link.parent.text:
-                advisor_id = link["href"].split('=')[-1]
-                advisors.append(advisor_id)
-        return advisors
+        mathematician, advisors = self.parse_mathematician(tree, level)
 
-    def scrape(self):
-        """BFS 방식으로 수학자 계보를 스크래핑"""
-        self.log(f"스크래핑 시작 (시작 ID: {self.start_id}, 최대 깊이: {self.end_depth})")
-        self.queue.append((self.start_id, 1))  # (id, level)
+        # 새로 파싱한 수학자 정보는 checkpoint_every명마다 체크포인트 파일에 기록
+        if mathematician and self.checkpoint_path:
+            self.pending.append((current_id, mathematician))
+            if len(self.pending) >= self.checkpoint_every:
+                self.flush_checkpoint()
 
-        while self.queue:
-            current_id, level = self.queue.popleft()
+        return self.add_mathematician(current_id, level, mathematician, advisors)
 
-            # 종료 조건 확인
-            if self.target_found and level > self.target_level:
-                break  # 목표 수학자의 세대보다 높은 세대에 도달
+    def restore_mathematician(self, current_id: str, level: int) -> List[str]:
+        """체크포인트에서 불러온 수학자 정보를 페이지를 다시 가져오지 않고 수집 결과에 반영
 
-            if not self.target_found and level > self.end_depth:
-                break  # 최대 세대 깊이보다 높은 세대에 도달
+        Args:
+            current_id (str): 현재 수학자 ID
+            level (int): 현재 세대 레벨
 
-            if current_id in self.visited:
-                self.log(f"이미 방문한 페이지 건너뛰기: {current_id}")
-                continue
+        Returns:
+            List[str]: 다음 세대에서 탐색할 Advisor ID 목록
+        """
+        mathematician = replace(self.checkpoint[current_id], level=level)
+        self.log(f"체크포인트에서 수학자 정보 복원: {mathematician.name} (ID: {current_id}, 레벨: {level})")
+        return self.add_mathematician(current_id, level, mathematician, mathematician.descended_from)
 
-            self.visited.add(current_id)
+    def add_mathematician(self, current_id: str, level: int, mathematician: Optional[Mathematician], advisors: List[str]) -> List[str]:
+        """수학자 정보와 Advisor 관계를 수집 결과에 추가하고 목표 수학자 여부를 확인
 
-            # 서버에 부담을 주지 않기 위해 지연 시간 추가
-            sleep(self.wait_sec)
+        Args:
+            current_id (str): 현재 수학자 ID
+            level (int): 현재 세대 레벨
+            mathematician (Optional[Mathematician]): 수학자 정보 또는 None (파싱 실패 시)
+            advisors (List[str]): Advisor ID 목록
 
-            soup = self.get_page(current_id)
-            if not soup:
-                continue
+        Returns:
+            List[str]: 다음 세대에서 탐색할 Advisor ID 목록 (파싱 실패 시 빈 목록)
+        """
+        self.log(f"Advisor ID 목록: {', '.join(advisors) if advisors else '없음'}")
 
-            # Advisor ID 목록 가져오기
-            advisors = self.get_advisors(soup)
-            self.log(f"Advisor ID 목록: {', '.join(advisors) if advisors else '없음'}")
+        # 자식 -> 부모(들) 매핑 업데이트
+        for advisor_id in advisors:
+            self.parent_map[advisor_id].append(current_id)
 
-            # 자식 -> 부모(들) 매핑 업데이트
-            for advisor_id in advisors:
-                if advisor_id not in self.parent_map:
-                    self.parent_map[advisor_id] = []
-                self.parent_map[advisor_id].append(current_id)
+        if not mathematician:
+            return []
+        self.mathematicians.append(mathematician)
 
-            mathematician = self.parse_mathematician(soup, level, advisors)
-            if mathematician:
-                self.mathematicians.append(mathematician)
+        # 목표 수학자 확인
+        if self.end_id and current_id == self.end_id and not self.target_found:
+            self.log(f"목표 수학자 (ID: {self.end_id})를 찾았습니다!")
+            self.target_found = True
+            self.target_level = level
 
-                # 목표 수학자 확인
-                if self.end_id and current_id == self.end_id and not self.target_found:
-                    self.log(f"목표 수학자 (ID: {self.end_id})를 찾았습니다!")
-                    self.target_found = True
-                    self.target_level = level
+        return advisors
 
-                # Advisor들을 가져와서 큐에 추가
-                for advisor_id in advisors:
-                    if advisor_id not in self.visited:
-                        self.queue.append((advisor_id, level + 1))
+    def load_checkpoint(self) -> Dict[str, Mathematician]:
+        """체크포인트 파일에서 이전 실행 때 수집한 수학자 정보를 불러옴
 
+        Returns:
+            Dict[str, Mathematician]: 요청한 ID -> 수학자 정보 (파일이 없으면 빈 dict)
+        """
+        checkpoint = {}
+        if not os.path.exists(self.checkpoint_path):
+            return checkpoint
+
+        with open(self.checkpoint_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if None in row or None in row.values():
+                    continue  # 기록 도중 중단되어 끊겼거나 다른 행과 이어 붙은 행은 건너뜀
+                # 페이지에서 파싱한 ID가 아닌, 페이지를 요청할 때 사용한 ID로 찾음
+                checkpoint[row["crawl_id"]] = Mathematician(
+                    name=row["name"],
+                    id=row["id"],
+                    university=row["university"],
+                    year=row["year"],
+                    degree_type=row["degree_type"],
+                    nationality=row["nationality"],
+                    level=int(row["level"]),
+                    descended_from=row["descended_from"].split(", ") if row["descended_from"] else []
+                )
+
+        self.log(f"체크포인트에서 {len(checkpoint)}명의 수학자 정보를 불러왔습니다: {self.checkpoint_path}")
+        return checkpoint
+
+    def flush_checkpoint(self):
+        """아직 기록하지 않은 수학자 정보를 체크포인트 파일에 이어서 기록"""
+        if not self.checkpoint_path or not self.pending:
+            return
+
+        write_header = not os.path.exists(self.checkpoint_path) or os.path.getsize(self.checkpoint_path) == 0
+
+        # 이전 실행이 행을 기록하던 도중 중단되었으면 끊긴 행에 이어 쓰지 않도록 줄을 바꿈
+        needs_newline = False
+        if not write_header:
+            with open(self.checkpoint_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+
+        with open(self.checkpoint_path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if needs_newline:
+                f.write("\r\n")
+            if write_header:
+                writer.writerow(self.CHECKPOINT_COLUMNS)
+            writer.writerows([crawl_id] + self.to_row(m) for crawl_id, m in self.pending)
+
+        self.log(f"체크포인트 저장 완료: {len(self.pending)}명 ({self.checkpoint_path})")
+        self.pending.clear()
+
+    def clear_checkpoint(self):
+        """결과 저장이 끝나 더 이상 필요 없는 체크포인트 파일을 삭제"""
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+            self.log(f"체크포인트 파일 삭제: {self.checkpoint_path}")
+
+    def log_summary(self):
+        """스크래핑 결과 요약 로그 출력"""
         if self.target_found:
             self.log(f"스크래핑 완료. 목표 수학자 및 동일 세대({self.target_level})의 수학자들까지 모두 수집했습니다. 총 {len(self.mathematicians)}명의 수학자 정보를 수집했습니다.")
         else:
             self.log(f"스크래핑 완료. 목표 수학자를 찾지 못했으며 최대 세대 깊이({self.end_depth})까지 모두 수집했습니다. 총 {len(self.mathematicians)}명의 수학자 정보를 수집했습니다.")
         self.log(f"스크래핑 완료. 총 {len(self.mathematicians)}명의 수학자 정보를 수집했습니다.")
 
+    def scrape(self):
+        """BFS 방식으로 수학자 계보를 스크래핑"""
+        self.log(f"스크래핑 시작 (시작 ID: {self.start_id}, 최대 깊이: {self.end_depth})")
+        # 최대 세대 깊이가 1보다 작으면 시작 수학자도 탐색하지 않음
+        if self.end_depth >= 1:
+            self.queue.append((self.start_id, 1))  # (id, level)
+            self.queued.add(self.start_id)
+
+        try:
+            while self.queue:
+                current_id, level = self.queue.popleft()
+
+                if current_id in self.checkpoint:
+                    # 이전 실행에서 이미 수집한 수학자는 페이지를 다시 가져오지 않음
+                    advisors = self.restore_mathematician(current_id, level)
+                else:
+                    # 서버에 부담을 주지 않기 위한 지연 시간은 get_page에서 적용
+                    tree = self.get_page(current_id)
+                    if tree is None:
+                        continue
+                    advisors = self.handle_page(current_id, level, tree)
+
+                # 목표 수학자보다 높은 세대는 방문하지 않으므로 큐에서 미리 제거 (큐는 세대 순으로 정렬되어 있음)
+                if self.target_found and self.queue and self.queue[-1][1] > self.target_level:
+                    self.queue = deque((id, lv) for id, lv in self.queue if lv <= self.target_level)
+
+                # 목표 수학자를 찾았거나 최대 세대 깊이에 도달했으면 다음 세대는 큐에 추가하지 않음
+                if self.target_found or level >= self.end_depth:
+                    continue
+
+                # Advisor들을 가져와서 아직 큐에 추가된 적 없는 경우에만 큐에 추가
+                for advisor_id in advisors:
+                    if advisor_id not in self.queued:
+                        self.queued.add(advisor_id)
+                        self.queue.append((advisor_id, level + 1))
+        finally:
+            # 중간에 오류로 중단되더라도 수집한 정보는 체크포인트에 남김
+            self.flush_checkpoint()
+
+        self.log_summary()
+
+    async def scrape_async(self):
+        """BFS 방식으로 수학자 계보를 비동기로 스크래핑
+
+        같은 세대의 페이지들은 서로 독립적이므로 세대 단위로 묶어 최대 concurrency개씩 동시에 요청하고,
+        응답은 요청 순서대로 파싱하여 BFS 순서를 유지합니다.
+        """
+        self.log(f"비동기 스크래핑 시작 (시작 ID: {self.start_id}, 최대 깊이: {self.end_depth}, 동시 요청 수: {self.concurrency})")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # HTTP/2 멀티플렉싱으로 동시 요청들이 하나의 TLS 연결을 공유
+        limits = httpx.Limits(max_connections=self.concurrency)
+
+        # 최대 세대 깊이가 1보다 작으면 시작 수학자도 탐색하지 않음
+        frontier = [self.start_id] if self.end_depth >= 1 else []  # 현재 세대에서 방문할 ID 목록
+        self.queued.update(frontier)
+        level = 1
+        try:
+            async with httpx.AsyncClient(http2=True, limits=limits, headers=self.HEADERS, timeout=self.TIMEOUT) as client:
+                while frontier:
+                    # 이전 실행에서 이미 수집한 수학자는 페이지를 다시 가져오지 않음
+                    to_fetch = [id for id in frontier if id not in self.checkpoint]
+                    self.log(f"{level}세대 페이지 {len(to_fetch)}개 요청 중")
+                    pages = await asyncio.gather(*[self.fetch_page_async(client, semaphore, id) for id in to_fetch])
+                    pages = dict(zip(to_fetch, pages))
+
+                    next_frontier = []
+                    for current_id in frontier:
+                        if current_id in self.checkpoint:
+                            advisors = self.restore_mathematician(current_id, level)
+                        else:
+                            page = pages[current_id]
+                            if page is None:
+                                continue
+                            tree = self.parse_page(current_id, *page)
+                            if tree is None:
+                                continue
+                            advisors = self.handle_page(current_id, level, tree)
+
+                        # 목표 수학자를 찾았거나 최대 세대 깊이에 도달했으면 다음 세대는 모으지 않음
+                        if self.target_found or level >= self.end_depth:
+                            continue
+
+                        for advisor_id in advisors:
+                            if advisor_id not in self.queued:
+                                self.queued.add(advisor_id)
+                                next_frontier.append(advisor_id)
+
+                    # 목표 수학자의 세대까지 모두 수집했으면 종료
+                    if self.target_found:
+                        break
+
+                    frontier = next_frontier
+                    level += 1
+        finally:
+            # 중간에 오류로 중단되더라도 수집한 정보는 체크포인트에 남김
+            self.flush_checkpoint()
+
+        self.log_summary()
+
+    def to_row(self, m: Mathematician) -> list:
+        """수학자 정보를 출력 컬럼 순서에 맞춘 행으로 변환
+
+        Args:
+            m (Mathematician): 수학자 정보
+
+        Returns:
+            list: COLUMNS 순서의 값 목록
+        """
+        # descended_from 리스트는 문자열로 변환 (Excel에서 보기 좋게), URL은 ID로부터 생성
+        return [m.name, m.id, m.university, m.year, m.degree_type, m.nationality, m.level, ", ".join(m.descended_from), self.page_url(m.id)]
+
+    def iter_rows(self) -> Iterator[list]:
+        """수집된 수학자 정보를 출력 컬럼 순서에 맞춘 행으로 하나씩 생성
+
+        Returns:
+            Iterator[list]: COLUMNS 순서의 값 목록
+        """
+        for m in self.mathematicians:
+            yield self.to_row(m)
+
     def save_to_excel(self, filename: str):
         """수집된 데이터를 Excel 파일로 저장
 
@@ -242,17 +652,30 @@ class MathGenealogyScraper:
         """
         self.log(f"Excel 파일 저장 중: {filename}")
 
-        # 데이터프레임 생성
-        df = pd.DataFrame([vars(m) for m in self.mathematicians])
+        # 쓰기 전용 모드로 행을 하나씩 스트리밍하여 메모리 사용량을 일정하게 유지
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(self.COLUMNS)
+        for row in self.iter_rows():
+            sheet.append(row)
 
-        # descended_from 리스트를 문자열로 변환 (Excel에서 보기 좋게)
-        df["descended_from"] = df["descended_from"].apply(lambda x: ", ".join(x) if x else '')
+        workbook.save(filename)
+        self.log(f"데이터가 {filename}에 저장되었습니다.")
+
+    def save_to_csv(self, filename: str):
+        """수집된 데이터를 CSV 파일로 저장
+
+        Args:
+            filename (str): 저장할 파일 이름
+        """
+        self.log(f"CSV 파일 저장 중: {filename}")
 
-        # 컬럼 순서 재정렬
-        columns = ["name", "id", "university", "year", "degree_type", "nationality", "level", "descended_from", "url"]
-        df = df[columns]
+        # Excel에서 열어도 글자가 깨지지 않도록 BOM을 포함한 UTF-8로 저장
+        with open(filename, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            writer.writerows(self.iter_rows())
 
-        df.to_excel(filename, index=False)
         self.log(f"데이터가 {filename}에 저장되었습니다.")
 
 def main():
@@ -261,21 +684,42 @@ def main():
     parser.add_argument("--end-id", type=int, help="탐색을 중단할 수학자의 ID")
     parser.add_argument("--end-depth", type=int, default=15, help="탐색을 중단할 최대 세대 깊이 (기본값: 15)")
     parser.add_argument("--wait-sec", type=float, default=2.5, help="요청 간 대기 시간 (초) (기본값: 2.5)")
-    parser.add_argument("--output", type=str, default="math_genealogy.xlsx", help="출력 파일 이름 (기본값: math_genealogy.xlsx)")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시에 보낼 최대 요청 수, 1보다 크면 비동기로 스크래핑 (기본값: 1)")
+    parser.add_argument("--cache-path", type=str, default="math_genealogy_cache.sqlite", help="페이지 캐시 파일 경로 (기본값: math_genealogy_cache.sqlite)")
+    parser.add_argument("--no-cache", action="store_const", const=None, dest="cache_path", help="페이지 캐시 비활성화")
+    parser.add_argument("--output", type=str, default="math_genealogy.xlsx", help="출력 파일 이름, .csv로 끝나면 CSV로 저장 (기본값: math_genealogy.xlsx)")
+    parser.add_argument("--checkpoint-path", type=str, default="", help="수집한 수학자 정보를 중간 저장할 CSV 파일 경로 (기본값: 출력 파일 이름.partial.csv)")
+    parser.add_argument("--no-checkpoint", action="store_const", const=None, dest="checkpoint_path", help="체크포인트 중간 저장 비활성화")
+    parser.add_argument("--checkpoint-every", type=int, default=100, help="체크포인트 파일에 기록할 수학자 수 단위 (기본값: 100)")
     parser.add_argument("--verbose", action="store_true", default=True, help="상세 로그 출력 (기본값: True)")
     parser.add_argument("--quiet", action="store_false", dest="verbose", help="로그 출력 비활성화")
 
     args = parser.parse_args()
+    checkpoint_path = args.checkpoint_path
+    if checkpoint_path == "":  # 지정하지 않으면 출력 파일 이름으로부터 생성
+        checkpoint_path = f"{os.path.splitext(args.output)[0]}.partial.csv"
 
     scraper = MathGenealogyScraper(
         start_id=args.start_id,
         end_id=args.end_id,
         end_depth=args.end_depth,
         wait_sec=args.wait_sec,
+        concurrency=args.concurrency,
+        cache_path=args.cache_path,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=args.checkpoint_every,
         verbose=args.verbose
     )
-    scraper.scrape()
-    scraper.save_to_excel(args.output)
+    if args.concurrency > 1:
+        asyncio.run(scraper.scrape_async())
+    else:
+        scraper.scrape()
+
+    if args.output.lower().endswith(".csv"):
+        scraper.save_to_csv(args.output)
+    else:
+        scraper.save_to_excel(args.output)
+    scraper.clear_checkpoint()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file